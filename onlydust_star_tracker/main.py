@@ -5,6 +5,10 @@ import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.io as pio
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import pycountry
 import streamlit as st
 import yaml
@@ -12,103 +16,223 @@ import yaml
 # Use built-in json module instead of orjson
 pio.json.config.default_engine = "json"
 
-
-def load_config():
+# Source CSV columns used by the dashboard
+_COLS = [
+    "contributor",
+    "total_rewarded_usd_amount",
+    "pr_count",
+    "ecosystems",
+    "country",
+    "languages",
+    "projects",
+    "categories",
+]
+
+# Bump whenever process_source_data changes its output, so stale processed
+# Parquet files are rebuilt instead of reused
+_PROCESSED_VERSION = "3"
+
+# ISO-2 country code to country name lookup, keyed by upper-case code
+_CODE_TO_NAME = {country.alpha_2: country.name for country in pycountry.countries}
+_CODE_TO_NAME["UNKNOWN"] = "Unknown"
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_config(config_mtime=None):
+    # config_mtime is only part of the cache key, so that edits to config.yaml
+    # are picked up without restarting the server
     with open("config.yaml", "r") as file:
         return yaml.safe_load(file)
 
 
-def load_and_process_data(config):
-    # Read the CSV data using the path from config
-    data_path = Path(config["data"]["source_path"])
-    if not data_path.exists():
-        st.error(f"Data file not found at {data_path}")
-        st.stop()
-
-    df = pd.read_csv(data_path)
+def file_mtime(path):
+    # Modification time used to invalidate cached data, None if missing
+    path = Path(path)
+    return path.stat().st_mtime if path.exists() else None
+
+
+def process_source_data(config, data_path):
+    df = pd.read_csv(
+        data_path,
+        engine="pyarrow",
+        dtype_backend="pyarrow",
+        usecols=_COLS,
+        dtype={
+            # Text columns are typed explicitly, a column that is empty in every
+            # row would otherwise be read as null[pyarrow]
+            "contributor": "string[pyarrow]",
+            "ecosystems": "string[pyarrow]",
+            "country": "string[pyarrow]",
+            "languages": "string[pyarrow]",
+            "projects": "string[pyarrow]",
+            "categories": "string[pyarrow]",
+            "pr_count": "int32[pyarrow]",
+            "total_rewarded_usd_amount": "float32[pyarrow]",
+        },
+    )
 
     # Clean and process data
     df["total_rewarded_usd_amount"] = df["total_rewarded_usd_amount"].fillna(0)
     df["pr_count"] = df["pr_count"].fillna(0)
 
-    # Calculate cost per PR
-    df["cost_per_pr"] = np.where(
-        df["pr_count"] > 0,
-        df["total_rewarded_usd_amount"] / df["pr_count"],
-        df["total_rewarded_usd_amount"],  # If no PRs, use total reward as cost
+    pr_count = df["pr_count"].to_numpy(dtype=np.float32)
+    rewards = df["total_rewarded_usd_amount"].to_numpy(dtype=np.float32)
+
+    # Calculate cost per PR, if no PRs use total reward as cost
+    df["cost_per_pr"] = np.divide(
+        rewards, pr_count, out=rewards.copy(), where=pr_count > 0
     )
 
     # Determine developer category based on config
-    def get_developer_category(pr_count):
-        categories = config["developer_categories"]
-        if pr_count <= categories["beginner"]["max_prs"]:
-            return "Beginner"
-        elif pr_count <= categories["rising_star"]["max_prs"]:
-            return "Rising Star"
-        elif pr_count <= categories["established"]["max_prs"]:
-            return "Established Developer"
-        elif pr_count <= categories["senior"]["max_prs"]:
-            return "Senior Contributor"
-        else:
-            return "Elite Developer"
-
-    df["developer_category"] = df["pr_count"].apply(get_developer_category)
+    categories = config["developer_categories"]
+    max_prs = [
+        categories["beginner"]["max_prs"],
+        categories["rising_star"]["max_prs"],
+        categories["established"]["max_prs"],
+        categories["senior"]["max_prs"],
+    ]
+    labels = [
+        "Beginner",
+        "Rising Star",
+        "Established Developer",
+        "Senior Contributor",
+        "Elite Developer",
+    ]
+    df["developer_category"] = pd.Categorical.from_codes(
+        np.searchsorted(max_prs, pr_count), categories=labels, ordered=True
+    )
 
     # Determine if developer is Starknet-exclusive
-    df["is_starknet_exclusive"] = df["ecosystems"].apply(
-        lambda x: True
-        if isinstance(x, str) and "Starknet" in x and "," not in x
-        else False
-    )
+    ecosystems = df["ecosystems"].fillna("")
+    df["is_starknet_exclusive"] = ecosystems.str.contains(
+        "Starknet", regex=False
+    ) & ~ecosystems.str.contains(",", regex=False)
 
     # Clean country codes
     df["country"] = df["country"].fillna("Unknown")
 
     # Convert ISO-2 country codes to country names
-    def country_code_to_name(code):
-        try:
-            if code == "Unknown":
-                return "Unknown"
-            else:
-                return pycountry.countries.get(alpha_2=code.strip()).name
-        except:
-            return "Unknown"
-
-    df["country_name"] = df["country"].apply(country_code_to_name)
+    df["country_name"] = (
+        df["country"].str.strip().str.upper().map(_CODE_TO_NAME).fillna("Unknown")
+    )
 
     # Ensure 'languages', 'projects', and 'categories' columns are lists
-    df["languages"] = (
-        df["languages"]
-        .fillna("")
-        .apply(lambda x: [lang.strip() for lang in str(x).split(",") if lang.strip()])
-    )
-    df["projects"] = (
-        df["projects"]
-        .fillna("")
-        .apply(lambda x: [proj.strip() for proj in str(x).split(",") if proj.strip()])
-    )
-    df["categories"] = (
-        df["categories"]
-        .fillna("")
-        .apply(lambda x: [cat.strip() for cat in str(x).split(",") if cat.strip()])
-    )
+    for col in ("languages", "projects", "categories"):
+        df[col] = _split_list_col(df[col])
+
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def load_and_process_data(config, source_mtime=None, contacts_mtime=None):
+    # source_mtime and contacts_mtime are only part of the cache key, so that
+    # edits to the source CSV or the contacts file trigger a reload
+    # Read the CSV data using the path from config
+    data_path = Path(config["data"]["source_path"])
+    if not data_path.exists():
+        st.error(f"Data file not found at {data_path}")
+        st.stop()
+
+    generated_dir = Path("data/generated")
+    generated_dir.mkdir(parents=True, exist_ok=True)  # Ensure the directory exists
+
+    # Reuse the processed data unless the source CSV or config is newer, or it
+    # was written by a different version of the processing code
+    processed_file = generated_dir / "processed.parquet"
+    if (
+        processed_file.exists()
+        and file_mtime(processed_file)
+        >= max(file_mtime(data_path), file_mtime("config.yaml"))
+        and _processed_version(processed_file) == _PROCESSED_VERSION
+    ):
+        table = pq.read_table(processed_file)
+    else:
+        table = pa.Table.from_pandas(
+            process_source_data(config, data_path), preserve_index=False
+        )
+        table = table.replace_schema_metadata(
+            {b"processed_version": _PROCESSED_VERSION.encode()}
+        )
+        pq.write_table(table, processed_file, compression="zstd")
+
+    # Convert from the Arrow table on both paths, so a fresh and a cached load
+    # return the same dtypes
+    df = table.to_pandas(types_mapper=_arrow_types_mapper, ignore_metadata=True)
 
     # Set the contacts file path
-    contacts_dir = Path("data/generated")
-    contacts_dir.mkdir(parents=True, exist_ok=True)  # Ensure the directory exists
-    contacts_file = contacts_dir / "contacts.csv"
+    contacts_file = generated_dir / "contacts.csv"
 
     if contacts_file.exists():
-        contacts_df = pd.read_csv(contacts_file)
+        contacts_df = pd.read_csv(contacts_file, engine="pyarrow")
     else:
         contacts_df = pd.DataFrame(columns=["Developer", "Contact", "Contacted"])
 
-    # Merge contact status into df
-    df = df.merge(contacts_df, how="left", left_on="contributor", right_on="Developer")
-    df["Contact"] = df["Contact"].fillna(False)
-    df["Contacted"] = df["Contacted"].fillna(False)
+    # Look up contact status for each contributor
+    contacts = contacts_df.drop_duplicates("Developer", keep="last").set_index(
+        "Developer"
+    )
+    for col in ("Contact", "Contacted"):
+        df[col] = df["contributor"].map(contacts[col]).fillna(False).astype(bool)
 
-    return df
+    # Filter options for the sidebar
+    all_languages, all_categories, all_projects = (
+        sorted(pc.unique(pc.list_flatten(pa.array(df[col]))).to_pylist())
+        for col in ("languages", "categories", "projects")
+    )
+
+    return df, all_languages, all_categories, all_projects
+
+
+def _processed_version(processed_file):
+    # Processing version recorded in the Parquet schema metadata, if any
+    metadata = pq.read_schema(processed_file).metadata or {}
+    version = metadata.get(b"processed_version")
+    return version.decode() if version is not None else None
+
+
+def _arrow_types_mapper(arrow_type):
+    # Keep Arrow-backed columns when converting the processed data, but let
+    # dictionary columns round-trip to ordered Categoricals
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def _to_arrow_array(series):
+    # Contiguous Arrow array for a Series, the pyarrow CSV engine reads large
+    # files in blocks so columns can be backed by several chunks
+    array = pa.array(series)
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    return array
+
+
+def _split_list_col(series):
+    # Split a comma-separated text column into an Arrow list<string> column,
+    # trimming whitespace and dropping empty items
+    lists = pc.split_pattern(_to_arrow_array(series.fillna("")), ",")
+    items = pc.utf8_trim_whitespace(pc.list_flatten(lists))
+    keep = pc.not_equal(items, "")
+    rows = pc.filter(pc.list_parent_indices(lists), keep).to_numpy()
+    offsets = np.zeros(len(series) + 1, dtype=np.int32)
+    np.cumsum(np.bincount(rows, minlength=len(series)), out=offsets[1:])
+    values = pa.ListArray.from_arrays(offsets, pc.filter(items, keep))
+    return pd.Series(pd.arrays.ArrowExtensionArray(values), index=series.index)
+
+
+def _mask_by_list_col(df, col, selected):
+    # Rows whose list column contains at least one of the selected values
+    lists = _to_arrow_array(df[col])
+    hits = pc.is_in(pc.list_flatten(lists), value_set=pa.array(selected))
+    mask = np.zeros(len(df), dtype=bool)
+    mask[pc.filter(pc.list_parent_indices(lists), hits).to_numpy()] = True
+    return mask
+
+
+def write_contacts(contacts_df, contacts_file):
+    # Write the contacts CSV with Arrow's native writer
+    table = pa.Table.from_pandas(contacts_df, preserve_index=False)
+    pacsv.write_csv(table, contacts_file)
 
 
 def save_contacts(df):
@@ -116,12 +240,239 @@ def save_contacts(df):
         columns={"contributor": "Developer"}
     )
     contacts_file = Path("data/generated/contacts.csv")
-    contacts_df.to_csv(contacts_file, index=False)
+    write_contacts(contacts_df, contacts_file)
+
+
+def _hash_frame(df):
+    # Streamlit cannot hash Arrow list columns, so hash their flattened values
+    # and lengths alongside the remaining columns
+    list_cols = [
+        col
+        for col, dtype in df.dtypes.items()
+        if isinstance(dtype, pd.ArrowDtype) and pa.types.is_list(dtype.pyarrow_dtype)
+    ]
+    parts = [pd.util.hash_pandas_object(df.drop(columns=list_cols), index=False)]
+    for col in list_cols:
+        lists = pa.array(df[col])
+        parts.append(pc.list_value_length(lists).to_numpy())
+        parts.append(
+            pd.util.hash_array(pc.list_flatten(lists).to_numpy(zero_copy_only=False))
+        )
+    return list(df.columns), b"".join(np.asarray(part).tobytes() for part in parts)
+
+
+# Figures are cached per filtered subset, so reruns with unchanged filters skip
+# rebuilding them
+_cache_figure = st.cache_data(
+    show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: _hash_frame}
+)
+
+
+@_cache_figure
+def _developer_category_chart(df):
+    category_counts = df["developer_category"].value_counts()
+    category_counts = category_counts[category_counts > 0].reset_index()
+    category_counts.columns = ["Category", "Count"]
+    fig_categories = px.bar(
+        category_counts,
+        x="Category",
+        y="Count",
+        color="Category",
+        labels={"Count": "Number of Developers"},
+        title="Developers by Category",
+    )
+    return fig_categories
+
+
+@_cache_figure
+def _country_investment_map(df):
+    country_investment = (
+        df.groupby("country_name")["total_rewarded_usd_amount"].sum().reset_index()
+    )
+    fig_map = px.choropleth(
+        country_investment,
+        locations="country_name",
+        locationmode="country names",
+        color="total_rewarded_usd_amount",
+        hover_name="country_name",
+        color_continuous_scale="Plasma",
+        labels={"total_rewarded_usd_amount": "Total Investment (USD)"},
+        projection="natural earth",
+        title="Investment Distribution Across the Globe",
+    )
+    fig_map.update_layout(
+        margin={"r": 0, "t": 50, "l": 0, "b": 0},
+        coloraxis_colorbar=dict(title="Total Investment (USD)"),
+    )
+    return fig_map
+
+
+@_cache_figure
+def _network_pie_chart(df):
+    starknet_only = int(df["is_starknet_exclusive"].sum())
+    fig_pie = px.pie(
+        values=[starknet_only, len(df) - starknet_only],
+        names=["Starknet Only", "Multi-chain"],
+        title="Developer Network Focus",
+    )
+    return fig_pie
+
+
+@_cache_figure
+def _category_investment_chart(df):
+    category_investment = (
+        df.explode("categories")
+        .groupby("categories")
+        .agg({"total_rewarded_usd_amount": "sum"})
+        .reset_index()
+    )
+    total_investment = category_investment["total_rewarded_usd_amount"].sum()
+    category_investment["percentage"] = (
+        category_investment["total_rewarded_usd_amount"] / total_investment
+    ) * 100
+
+    fig_category = px.pie(
+        category_investment,
+        values="total_rewarded_usd_amount",
+        names="categories",
+        title="Percentage of Total Investment by Category",
+        labels={
+            "categories": "Category",
+            "total_rewarded_usd_amount": "Total Investment (USD)",
+        },
+        hover_data=["percentage"],
+    )
+    return fig_category
+
+
+@_cache_figure
+def _language_investment_chart(df):
+    language_investment = (
+        df.explode("languages")
+        .groupby("languages")
+        .agg({"total_rewarded_usd_amount": "sum", "pr_count": "sum"})
+        .reset_index()
+    )
+    language_investment["avg_cost_per_pr"] = (
+        language_investment["total_rewarded_usd_amount"]
+        / language_investment["pr_count"]
+    )
+    # Sort the data
+    language_investment = language_investment.sort_values(
+        "total_rewarded_usd_amount", ascending=False
+    )
+    fig_lang = px.bar(
+        language_investment,
+        x="languages",
+        y="total_rewarded_usd_amount",
+        color="avg_cost_per_pr",
+        labels={
+            "total_rewarded_usd_amount": "Total Investment (USD)",
+            "languages": "Programming Language",
+            "avg_cost_per_pr": "Average Cost per PR (USD)",
+        },
+        title="Total Investment by Programming Language",
+        color_continuous_scale="Viridis",
+    )
+    fig_lang.update_layout(
+        xaxis_title="Programming Language",
+        yaxis_title="Total Investment (USD)",
+        coloraxis_colorbar=dict(
+            title="Avg Cost per PR (USD)",
+            thicknessmode="pixels",
+            thickness=15,
+            lenmode="pixels",
+            len=300,
+            xpad=10,
+            yanchor="middle",
+            y=0.5,
+        ),
+    )
+    return fig_lang
+
+
+@_cache_figure
+def _project_investment_chart(df):
+    project_investment = (
+        df.explode("projects")
+        .groupby("projects")
+        .agg({"total_rewarded_usd_amount": "sum", "pr_count": "sum"})
+        .reset_index()
+    )
+    project_investment["avg_cost_per_pr"] = (
+        project_investment["total_rewarded_usd_amount"] / project_investment["pr_count"]
+    )
+    # Sort the data
+    project_investment = project_investment.sort_values(
+        "total_rewarded_usd_amount", ascending=False
+    )
+    fig_project = px.bar(
+        project_investment,
+        x="projects",
+        y="total_rewarded_usd_amount",
+        color="avg_cost_per_pr",
+        labels={
+            "total_rewarded_usd_amount": "Total Investment (USD)",
+            "projects": "Project",
+            "avg_cost_per_pr": "Average Cost per PR (USD)",
+        },
+        title="Total Investment by Project",
+        color_continuous_scale="Cividis",
+    )
+    fig_project.update_layout(
+        xaxis_title="Project",
+        yaxis_title="Total Investment (USD)",
+        xaxis={"categoryorder": "total descending"},
+        coloraxis_colorbar=dict(
+            title="Avg Cost per PR (USD)",
+            thicknessmode="pixels",
+            thickness=15,
+            lenmode="pixels",
+            len=300,
+            xpad=10,
+            yanchor="middle",
+            y=0.5,
+        ),
+    )
+    return fig_project
+
+
+@_cache_figure
+def _top_contributors_chart(df):
+    rewards = df["total_rewarded_usd_amount"].to_numpy()
+    k = min(50, rewards.size)
+    top_idx = np.arange(0)
+    if k:
+        # Partition only to find the cutoff, then fill the remaining places with
+        # the first rows tied at the cutoff, as nlargest does
+        cutoff = np.partition(rewards, rewards.size - k)[rewards.size - k]
+        above = np.flatnonzero(rewards > cutoff)
+        tied = np.flatnonzero(rewards == cutoff)[: k - above.size]
+        top_idx = np.sort(np.concatenate([above, tied]))
+    top_contributors = df.iloc[top_idx].sort_values(
+        "total_rewarded_usd_amount", ascending=False, kind="stable"
+    )
+    fig_top_contributors = px.bar(
+        top_contributors,
+        x="contributor",
+        y="total_rewarded_usd_amount",
+        labels={
+            "total_rewarded_usd_amount": "Total Rewards (USD)",
+            "contributor": "Contributor",
+        },
+        title="Top 50 Contributors",
+    )
+    fig_top_contributors.update_layout(
+        xaxis_title="Contributor",
+        yaxis_title="Total Rewards (USD)",
+        xaxis_tickangle=-45,
+    )
+    return fig_top_contributors
 
 
 def main():
     # Load configuration
-    config = load_config()
+    config = load_config(config_mtime=file_mtime("config.yaml"))
 
     # Set page configuration
     st.set_page_config(
@@ -131,45 +482,35 @@ def main():
     )
 
     # Load and process data
-    df = load_and_process_data(config)
+    df, all_languages, all_categories, all_projects = load_and_process_data(
+        config,
+        source_mtime=file_mtime(config["data"]["source_path"]),
+        contacts_mtime=file_mtime("data/generated/contacts.csv"),
+    )
 
     # Sidebar filters
     st.sidebar.header("Filters")
 
     # Language filter
-    all_languages = sorted(set([lang for langs in df["languages"] for lang in langs]))
     selected_languages = st.sidebar.multiselect(
         "Select Programming Languages", all_languages
     )
 
     # Category filter
-    all_categories = sorted(set([cat for cats in df["categories"] for cat in cats]))
     selected_categories = st.sidebar.multiselect("Select Categories", all_categories)
 
     # Project filter
-    all_projects = sorted(set([proj for projs in df["projects"] for proj in projs]))
     selected_projects = st.sidebar.multiselect("Select Projects", all_projects)
 
     # Apply filters
-    filtered_df = df.copy()
+    mask = np.ones(len(df), dtype=bool)
     if selected_languages:
-        filtered_df = filtered_df[
-            filtered_df["languages"].apply(
-                lambda langs: any(lang in langs for lang in selected_languages)
-            )
-        ]
+        mask &= _mask_by_list_col(df, "languages", selected_languages)
     if selected_categories:
-        filtered_df = filtered_df[
-            filtered_df["categories"].apply(
-                lambda cats: any(cat in cats for cat in selected_categories)
-            )
-        ]
+        mask &= _mask_by_list_col(df, "categories", selected_categories)
     if selected_projects:
-        filtered_df = filtered_df[
-            filtered_df["projects"].apply(
-                lambda projs: any(proj in projs for proj in selected_projects)
-            )
-        ]
+        mask &= _mask_by_list_col(df, "projects", selected_projects)
+    filtered_df = df.loc[mask]
 
     # Organize content into tabs
     tab1, tab2 = st.tabs(["Overview", "Developers and Projects"])
@@ -180,18 +521,28 @@ def main():
         st.caption(f"Data as of {config['data']['timestamp']}")
 
         # Display metrics
+        metrics = filtered_df.agg(
+            {
+                "pr_count": "sum",
+                "cost_per_pr": "mean",
+                "total_rewarded_usd_amount": "sum",
+            }
+        )
         col1, col2, col3, col4 = st.columns(4)
         with col1:
             st.metric("Total Developers", len(filtered_df))
         with col2:
-            st.metric("Total PRs", int(filtered_df["pr_count"].sum()))
+            st.metric("Total PRs", int(metrics["pr_count"]))
         with col3:
-            avg_cost = filtered_df["cost_per_pr"].mean()
-            st.metric("Average Cost per PR", f"${avg_cost:,.2f}")
+            avg_cost = metrics["cost_per_pr"]
+            st.metric(
+                "Average Cost per PR",
+                f"${avg_cost:,.2f}" if pd.notna(avg_cost) else "N/A",
+            )
         with col4:
             st.metric(
                 "Total Investment",
-                f"${filtered_df['total_rewarded_usd_amount'].sum():,.2f}",
+                f"${metrics['total_rewarded_usd_amount']:,.2f}",
             )
 
         # Developer Categories Distribution
@@ -199,67 +550,32 @@ def main():
         st.write(
             "This chart shows the distribution of developers across different categories based on the number of pull requests they have made."
         )
-        category_counts = filtered_df["developer_category"].value_counts().reset_index()
-        category_counts.columns = ["Category", "Count"]
-        fig_categories = px.bar(
-            category_counts,
-            x="Category",
-            y="Count",
-            color="Category",
-            labels={"Count": "Number of Developers"},
-            title="Developers by Category",
-        )
-        st.plotly_chart(fig_categories)
+        st.plotly_chart(_developer_category_chart(filtered_df[["developer_category"]]))
 
         # World Map of Investment
         st.subheader("Global Investment Distribution")
         st.write(
             "This map illustrates the total investment in USD distributed across different countries."
         )
-        country_investment = (
-            filtered_df.groupby("country_name")["total_rewarded_usd_amount"]
-            .sum()
-            .reset_index()
-        )
-        fig_map = px.choropleth(
-            country_investment,
-            locations="country_name",
-            locationmode="country names",
-            color="total_rewarded_usd_amount",
-            hover_name="country_name",
-            color_continuous_scale="Plasma",
-            labels={"total_rewarded_usd_amount": "Total Investment (USD)"},
-            projection="natural earth",
-            title="Investment Distribution Across the Globe",
-        )
-        fig_map.update_layout(
-            margin={"r": 0, "t": 50, "l": 0, "b": 0},
-            coloraxis_colorbar=dict(title="Total Investment (USD)"),
+        st.plotly_chart(
+            _country_investment_map(
+                filtered_df[["country_name", "total_rewarded_usd_amount"]]
+            )
         )
-        st.plotly_chart(fig_map)
 
         # Network Distribution
         st.subheader("Developer Network Distribution")
         st.write(
             "This pie chart shows the focus of developers on Starknet exclusively or across multiple chains."
         )
-        network_dist = filtered_df["is_starknet_exclusive"].value_counts()
-        network_labels = [
-            "Starknet Only" if val else "Multi-chain" for val in network_dist.index
-        ]
-        fig_pie = px.pie(
-            values=network_dist.values,
-            names=network_labels,
-            title="Developer Network Focus",
-        )
-        st.plotly_chart(fig_pie)
+        st.plotly_chart(_network_pie_chart(filtered_df[["is_starknet_exclusive"]]))
 
     with tab2:
         # Developer Details
         st.subheader("Developer Details")
 
         # Developer Category Filter
-        developer_categories = sorted(filtered_df["developer_category"].unique())
+        developer_categories = filtered_df["developer_category"].cat.categories
         selected_dev_categories = st.multiselect(
             "Filter by Developer Category", developer_categories
         )
@@ -303,11 +619,16 @@ def main():
         )
 
         # Update contacts when the table is edited
-        if "developer_table_editor" in st.session_state:
+        # Only write when the contacts actually changed, since rewriting the
+        # file invalidates the cached data on the next rerun
+        contact_columns = ["Developer", "Contact", "Contacted"]
+        contacts_df = edited_table[contact_columns]
+        if "developer_table_editor" in st.session_state and not contacts_df.equals(
+            developer_table[contact_columns]
+        ):
             # Update the contacts data
-            contacts_df = edited_table[["Developer", "Contact", "Contacted"]]
             contacts_file = Path("data/generated/contacts.csv")
-            contacts_df.to_csv(contacts_file, index=False)
+            write_contacts(contacts_df, contacts_file)
             st.success("Contacts updated successfully!")
 
         # Investment by Category
@@ -315,149 +636,44 @@ def main():
         st.write(
             "This pie chart shows the percentage of the total investment assigned to different categories such as DeFi, Infrastructure, etc."
         )
-        category_investment = (
-            filtered_df.explode("categories")
-            .groupby("categories")
-            .agg({"total_rewarded_usd_amount": "sum"})
-            .reset_index()
-        )
-        total_investment = category_investment["total_rewarded_usd_amount"].sum()
-        category_investment["percentage"] = (
-            category_investment["total_rewarded_usd_amount"] / total_investment
-        ) * 100
-
-        fig_category = px.pie(
-            category_investment,
-            values="total_rewarded_usd_amount",
-            names="categories",
-            title="Percentage of Total Investment by Category",
-            labels={
-                "categories": "Category",
-                "total_rewarded_usd_amount": "Total Investment (USD)",
-            },
-            hover_data=["percentage"],
+        st.plotly_chart(
+            _category_investment_chart(
+                filtered_df[["categories", "total_rewarded_usd_amount"]]
+            )
         )
-        st.plotly_chart(fig_category)
 
         # Investment by Programming Language
         st.subheader("Investment by Programming Language")
         st.write(
             "This bar chart displays the total investment and average cost per PR for each programming language, ordered from highest to lowest investment."
         )
-        language_investment = (
-            filtered_df.explode("languages")
-            .groupby("languages")
-            .agg({"total_rewarded_usd_amount": "sum", "pr_count": "sum"})
-            .reset_index()
-        )
-        language_investment["avg_cost_per_pr"] = (
-            language_investment["total_rewarded_usd_amount"]
-            / language_investment["pr_count"]
-        )
-        # Sort the data
-        language_investment = language_investment.sort_values(
-            "total_rewarded_usd_amount", ascending=False
-        )
-        fig_lang = px.bar(
-            language_investment,
-            x="languages",
-            y="total_rewarded_usd_amount",
-            color="avg_cost_per_pr",
-            labels={
-                "total_rewarded_usd_amount": "Total Investment (USD)",
-                "languages": "Programming Language",
-                "avg_cost_per_pr": "Average Cost per PR (USD)",
-            },
-            title="Total Investment by Programming Language",
-            color_continuous_scale="Viridis",
-        )
-        fig_lang.update_layout(
-            xaxis_title="Programming Language",
-            yaxis_title="Total Investment (USD)",
-            coloraxis_colorbar=dict(
-                title="Avg Cost per PR (USD)",
-                thicknessmode="pixels",
-                thickness=15,
-                lenmode="pixels",
-                len=300,
-                xpad=10,
-                yanchor="middle",
-                y=0.5,
-            ),
+        st.plotly_chart(
+            _language_investment_chart(
+                filtered_df[["languages", "total_rewarded_usd_amount", "pr_count"]]
+            )
         )
-        st.plotly_chart(fig_lang)
 
         # Investment by Project
         st.subheader("Investment by Project")
         st.write(
             "This bar chart shows the total investment and average cost per PR for each project, ordered from highest to lowest investment."
         )
-        project_investment = (
-            filtered_df.explode("projects")
-            .groupby("projects")
-            .agg({"total_rewarded_usd_amount": "sum", "pr_count": "sum"})
-            .reset_index()
-        )
-        project_investment["avg_cost_per_pr"] = (
-            project_investment["total_rewarded_usd_amount"]
-            / project_investment["pr_count"]
-        )
-        # Sort the data
-        project_investment = project_investment.sort_values(
-            "total_rewarded_usd_amount", ascending=False
-        )
-        fig_project = px.bar(
-            project_investment,
-            x="projects",
-            y="total_rewarded_usd_amount",
-            color="avg_cost_per_pr",
-            labels={
-                "total_rewarded_usd_amount": "Total Investment (USD)",
-                "projects": "Project",
-                "avg_cost_per_pr": "Average Cost per PR (USD)",
-            },
-            title="Total Investment by Project",
-            color_continuous_scale="Cividis",
-        )
-        fig_project.update_layout(
-            xaxis_title="Project",
-            yaxis_title="Total Investment (USD)",
-            xaxis={"categoryorder": "total descending"},
-            coloraxis_colorbar=dict(
-                title="Avg Cost per PR (USD)",
-                thicknessmode="pixels",
-                thickness=15,
-                lenmode="pixels",
-                len=300,
-                xpad=10,
-                yanchor="middle",
-                y=0.5,
-            ),
+        st.plotly_chart(
+            _project_investment_chart(
+                filtered_df[["projects", "total_rewarded_usd_amount", "pr_count"]]
+            )
         )
-        st.plotly_chart(fig_project)
 
         # Top Contributors
         st.subheader("Top Contributors by Total Rewards")
         st.write(
             "This bar chart displays the top 50 contributors based on the total rewards they have received."
         )
-        top_contributors = filtered_df.nlargest(50, "total_rewarded_usd_amount")
-        fig_top_contributors = px.bar(
-            top_contributors,
-            x="contributor",
-            y="total_rewarded_usd_amount",
-            labels={
-                "total_rewarded_usd_amount": "Total Rewards (USD)",
-                "contributor": "Contributor",
-            },
-            title="Top 50 Contributors",
-        )
-        fig_top_contributors.update_layout(
-            xaxis_title="Contributor",
-            yaxis_title="Total Rewards (USD)",
-            xaxis_tickangle=-45,
+        st.plotly_chart(
+            _top_contributors_chart(
+                filtered_df[["contributor", "total_rewarded_usd_amount"]]
+            )
         )
-        st.plotly_chart(fig_top_contributors)
 
 
 if __name__ == "__main__":
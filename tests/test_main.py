@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import yaml
+
+from onlydust_star_tracker.main import (
+    _hash_frame,
+    _mask_by_list_col,
+    _split_list_col,
+    load_and_process_data,
+)
+
+CONFIG = {
+    "data": {"source_path": "source.csv"},
+    "developer_categories": {
+        "beginner": {"max_prs": 2},
+        "rising_star": {"max_prs": 6},
+        "established": {"max_prs": 15},
+        "senior": {"max_prs": 30},
+    },
+}
+
+SOURCE_CSV = """contributor,projects,categories,languages,ecosystems,country,total_rewarded_usd_amount,pr_count
+alice,"Dojo,Madara",DeFi,"Cairo,Rust",Starknet,US,100.5,1
+bob,Madara,,Cairo,"Starknet,Ethereum",fr,250,5
+carol,,,,,,,
+dave,Dojo,Gaming,Rust,Starknet,DE,900,40
+"""
+
+
+def test_split_list_col_trims_whitespace_and_drops_empty_items():
+    series = pd.Series(["Cairo, Rust", " Python ,, ", ",", "Go"])
+
+    result = _split_list_col(series)
+
+    assert result.tolist() == [["Cairo", "Rust"], ["Python"], [], ["Go"]]
+
+
+def test_split_list_col_handles_missing_values():
+    series = pd.Series(["Cairo", None, np.nan, "Rust,Cairo"], index=[3, 5, 7, 9])
+
+    result = _split_list_col(series)
+
+    assert result.tolist() == [["Cairo"], [], [], ["Rust", "Cairo"]]
+    assert result.index.tolist() == [3, 5, 7, 9]
+
+
+def test_mask_by_list_col_matches_any_selected_value():
+    df = pd.DataFrame(
+        {"languages": _split_list_col(pd.Series(["Cairo,Rust", "", "Python", "Rust"]))}
+    )
+
+    mask = _mask_by_list_col(df, "languages", ["Rust", "Python"])
+
+    assert mask.tolist() == [True, False, True, True]
+
+
+def test_mask_by_list_col_with_no_matches():
+    df = pd.DataFrame({"languages": _split_list_col(pd.Series(["Cairo", None, ""]))})
+
+    mask = _mask_by_list_col(df, "languages", ["Zig"])
+
+    assert mask.dtype == bool
+    assert not mask.any()
+
+
+def test_split_list_col_handles_multi_chunk_input():
+    chunks = pa.chunked_array([["Cairo, Rust", None], [" Go,,", "Rust"]])
+    series = pd.Series(pd.arrays.ArrowExtensionArray(chunks))
+
+    result = _split_list_col(series)
+
+    assert result.tolist() == [["Cairo", "Rust"], [], ["Go"], ["Rust"]]
+
+
+def test_mask_by_list_col_handles_multi_chunk_input():
+    chunks = pa.chunked_array([[["Cairo"], []], [["Rust", "Go"], ["Cairo", "Rust"]]])
+    df = pd.DataFrame({"languages": pd.arrays.ArrowExtensionArray(chunks)})
+
+    mask = _mask_by_list_col(df, "languages", ["Rust"])
+
+    assert mask.tolist() == [False, False, True, True]
+
+
+def _frame(languages):
+    return pd.DataFrame(
+        {
+            "languages": _split_list_col(pd.Series(languages)),
+            "total_rewarded_usd_amount": [10.0] * len(languages),
+        }
+    )
+
+
+def test_hash_frame_is_stable_for_equal_frames():
+    assert _hash_frame(_frame(["Cairo,Rust", "Go"])) == _hash_frame(
+        _frame(["Cairo,Rust", "Go"])
+    )
+
+
+def test_hash_frame_changes_with_a_single_list_element():
+    assert _hash_frame(_frame(["Cairo,Rust", "Go"])) != _hash_frame(
+        _frame(["Cairo,Zig", "Go"])
+    )
+
+
+def test_hash_frame_changes_when_items_move_between_rows():
+    assert _hash_frame(_frame(["Cairo,Rust", "Go"])) != _hash_frame(
+        _frame(["Cairo", "Rust,Go"])
+    )
+
+
+def test_load_and_process_data_cold_and_cached_loads_match(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config.yaml").write_text(yaml.safe_dump(CONFIG))
+    (tmp_path / "source.csv").write_text(SOURCE_CSV)
+    processed_file = tmp_path / "data" / "generated" / "processed.parquet"
+
+    cold, *cold_options = load_and_process_data.__wrapped__(CONFIG)
+    written_at = processed_file.stat().st_mtime_ns
+    warm, *warm_options = load_and_process_data.__wrapped__(CONFIG)
+
+    # The second load must come from the Parquet file, not a rebuild
+    assert processed_file.stat().st_mtime_ns == written_at
+    assert cold.dtypes.to_dict() == warm.dtypes.to_dict()
+    pd.testing.assert_frame_equal(cold, warm)
+    assert cold_options == warm_options
+    for df in (cold, warm):
+        dtype = df["developer_category"].dtype
+        assert isinstance(dtype, pd.CategoricalDtype)
+        assert dtype.ordered
+        assert dtype.categories.tolist() == [
+            "Beginner",
+            "Rising Star",
+            "Established Developer",
+            "Senior Contributor",
+            "Elite Developer",
+        ]